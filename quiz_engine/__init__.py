@@ -0,0 +1,29 @@
+"""
+Shared quiz engine used by both the CLI (quiz_game.py) and the web app (app.py)
+
+Questions always use the web format: a list of plain option strings and the
+index (0-3) of the correct option. Front-ends are responsible for how the
+options are displayed and how answers are entered.
+"""
+
+from .ai import GeminiClient, parse_questions
+from .engine import check_answer, feedback, percentage, run_quiz
+from .questions import (AIQuestionSource, DEFAULT_QUESTIONS, DefaultQuestionSource,
+                        MAX_AI_QUESTIONS, OPTION_LETTERS)
+from .storage import JSONHighScoreStore, leaderboard_key
+
+__all__ = [
+    "AIQuestionSource",
+    "DEFAULT_QUESTIONS",
+    "DefaultQuestionSource",
+    "GeminiClient",
+    "JSONHighScoreStore",
+    "MAX_AI_QUESTIONS",
+    "OPTION_LETTERS",
+    "check_answer",
+    "feedback",
+    "leaderboard_key",
+    "parse_questions",
+    "percentage",
+    "run_quiz",
+]
@@ -0,0 +1,168 @@
+"""
+Google Gemini client for AI question generation
+"""
+
+import json
+import os
+
+from .questions import OPTION_LETTERS
+
+MODEL_NAME = 'gemini-2.0-flash-exp'
+
+PROMPT_TEMPLATE = """Generate {num_questions} multiple choice quiz questions about {topic}.
+
+For each question, provide:
+1. The question text
+2. Four options
+3. The correct answer index (0-3)
+
+Format your response as a valid JSON array with this exact structure:
+[
+    {{
+        "question": "Question text here?",
+        "options": ["First option", "Second option", "Third option", "Fourth option"],
+        "answer": 2
+    }}
+]
+
+Make the questions engaging and educational. Ensure variety in difficulty levels.
+Return ONLY the JSON array, no additional text or markdown formatting."""
+
+
+def parse_questions(response_text):
+    """Parse the model's JSON reply, stripping markdown code fences
+    
+    Questions that do not match the engine's format are dropped. Raises
+    ValueError if the reply is not JSON or has no usable questions.
+    """
+    response_text = response_text.strip()
+    
+    # Remove markdown code blocks if present
+    if response_text.startswith("```json"):
+        response_text = response_text[7:]
+    elif response_text.startswith("```"):
+        response_text = response_text[3:]
+    
+    if response_text.endswith("```"):
+        response_text = response_text[:-3]
+    
+    items = json.loads(response_text.strip())
+    if not isinstance(items, list):
+        raise ValueError("AI response is not a list of questions")
+    
+    questions = [q for q in map(normalize_question, items) if q is not None]
+    if not questions:
+        raise ValueError("AI response has no valid questions")
+    return questions
+
+
+def normalize_question(item):
+    """Return item in the engine's question format, or None if it is invalid
+    
+    The answer may be an option index, a digit string or an A-D letter and
+    is always returned as an index into exactly four options.
+    """
+    if not isinstance(item, dict):
+        return None
+    question = item.get("question")
+    options = item.get("options")
+    if not isinstance(question, str) or not question.strip():
+        return None
+    if (not isinstance(options, list) or len(options) != len(OPTION_LETTERS)
+            or not all(isinstance(option, str) for option in options)):
+        return None
+    
+    answer = item.get("answer")
+    if isinstance(answer, str):
+        answer = answer.strip().upper()
+        if answer in OPTION_LETTERS:
+            answer = OPTION_LETTERS.index(answer)
+        elif answer.isdigit():
+            answer = int(answer)
+    if isinstance(answer, bool) or not isinstance(answer, int):
+        return None
+    if not 0 <= answer < len(OPTION_LETTERS):
+        return None
+    return {"question": question, "options": options, "answer": answer}
+
+
+class GeminiClient:
+    """Wraps the Gemini model and remembers the last error for diagnostics"""
+    
+    def __init__(self, config_file="config.json", model_name=MODEL_NAME):
+        self.config_file = config_file
+        self.model_name = model_name
+        self.api_key = None
+        self.model = None
+        self.error = None
+    
+    @property
+    def available(self):
+        return self.model is not None
+    
+    def setup(self):
+        """Configure the API from GEMINI_API_KEY or the config file
+        
+        Returns True if the model is ready to use.
+        """
+        try:
+            # Environment variable first (for Vercel/production), then the
+            # config file (for local development)
+            api_key = os.environ.get('GEMINI_API_KEY')
+            
+            if not api_key and os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as f:
+                    config = json.load(f)
+                    api_key = config.get("gemini_api_key")
+            
+            if not api_key:
+                self.error = None
+                self.model = None
+                return False
+            return self.configure(api_key)
+        except Exception as e:
+            self.error = str(e)
+            self.model = None
+            return False
+    
+    def configure(self, api_key):
+        """Configure the API with the given key, returning True on success"""
+        self.error = None
+        self.api_key = api_key
+        try:
+            # Imported here so the rest of the engine works without the SDK
+            import google.generativeai as genai
+            genai.configure(api_key=api_key)
+            # Some API keys may not have access to the model. Keep the error
+            # so front-ends can show it and carry on without AI features.
+            self.model = genai.GenerativeModel(self.model_name)
+            return True
+        except Exception as e:
+            self.error = str(e)
+            self.model = None
+            return False
+    
+    def generate_questions(self, topic, num_questions):
+        """Generate questions about a topic, or return None on failure"""
+        if not self.model:
+            print("❌ Gemini API is not configured. Cannot generate AI questions.")
+            return None
+        
+        try:
+            prompt = PROMPT_TEMPLATE.format(topic=topic, num_questions=num_questions)
+            response = self.model.generate_content(prompt)
+            return parse_questions(response.text)
+        except json.JSONDecodeError as e:
+            print(f"❌ Error parsing AI response: {e}")
+            self.error = f"AI response not valid JSON: {e}"
+            return None
+        except ValueError as e:
+            print(f"❌ Error parsing AI response: {e}")
+            self.error = str(e)
+            return None
+        except Exception as e:
+            # Capture errors like NOT_FOUND (model not found) or permission issues
+            err = str(e)
+            print(f"❌ Error generating questions: {err}")
+            self.error = err
+            return None
@@ -0,0 +1,156 @@
+"""
+Benchmark suite for the shared quiz engine
+
+Run with: python -m quiz_engine.bench
+Front-ends register their own benchmarks with @benchmark and call main(),
+see web_bench.py.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from .ai import parse_questions
+from .engine import run_quiz
+from .questions import DEFAULT_QUESTIONS, DefaultQuestionSource
+from .simulation import print_simulation_report, simulate_games
+from .storage import JSONHighScoreStore
+
+BENCHMARKS = {}
+SIZED_BENCHMARKS = set()
+
+
+def benchmark(name, report_size=False):
+    """Register a benchmark
+    
+    The function takes a scratch dir and returns the callable to time, or a
+    (callable, reset) pair where reset runs untimed before every call. With
+    report_size the length of the callable's result is reported as bytes.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        if report_size:
+            SIZED_BENCHMARKS.add(name)
+        return setup
+    return register
+
+
+@benchmark("default_questions")
+def bench_default_questions(tmpdir):
+    source = DefaultQuestionSource()
+    return source.get_questions
+
+
+@benchmark("run_quiz")
+def bench_run_quiz(tmpdir):
+    rng = random.Random(0)
+    questions = DefaultQuestionSource(rng=rng).get_questions()
+    return lambda: run_quiz(questions, lambda number, question: rng.randrange(4))
+
+
+@benchmark("parse_ai_response")
+def bench_parse_ai_response(tmpdir):
+    response_text = "```json\n" + json.dumps(DEFAULT_QUESTIONS) + "\n```"
+    return lambda: parse_questions(response_text)
+
+
+def high_score_fixture(size=1000):
+    """Return size leaderboard entries, the same on every run"""
+    rng = random.Random(0)
+    return [{"name": f"p{i}", "score": rng.randrange(11), "total": 10,
+             "percentage": rng.randrange(101), "date": "2024-01-01 00:00:00"}
+            for i in range(size)]
+
+
+@benchmark("high_score_add_1000_entries")
+def bench_high_score_add(tmpdir):
+    store = JSONHighScoreStore(os.path.join(tmpdir, "add.json"))
+    fixture = high_score_fixture()
+    # Reset the file each time so the result does not depend on --iterations
+    return lambda: store.add("bench", 7, 10), lambda: store.save(fixture)
+
+
+@benchmark("leaderboard_top10_1000_entries")
+def bench_leaderboard(tmpdir):
+    store = JSONHighScoreStore(os.path.join(tmpdir, "top.json"))
+    store.save(high_score_fixture())
+    return store.top
+
+
+def time_benchmark(func, iterations, reset=None):
+    """Return the mean seconds per call, leaving reset out of the timing"""
+    if reset is None:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations
+    
+    total = 0.0
+    for _ in range(iterations):
+        reset()
+        start = time.perf_counter()
+        func()
+        total += time.perf_counter() - start
+    return total / iterations
+
+
+def run_benchmarks(iterations=1000, names=None):
+    """Run the registered benchmarks
+    
+    Returns {name: (seconds per call, bytes)} where bytes is None unless the
+    benchmark was registered with report_size.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, setup in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            target = setup(tmpdir)
+            func, reset = target if isinstance(target, tuple) else (target, None)
+            seconds = time_benchmark(func, iterations, reset)
+            size = None
+            if name in SIZED_BENCHMARKS:
+                if reset:
+                    reset()
+                size = len(func())
+            results[name] = (seconds, size)
+    return results
+
+
+def main(description="Benchmark the shared quiz engine"):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("-n", "--iterations", type=int, default=1000,
+                        help="iterations per benchmark")
+    parser.add_argument("--simulate", type=int, metavar="GAMES",
+                        help="also run GAMES multi-process simulated games")
+    parser.add_argument("--workers", type=int, help="worker processes for --simulate")
+    args = parser.parse_args()
+    
+    if args.iterations < 1:
+        parser.error("--iterations must be at least 1")
+    if args.simulate is not None and args.simulate < 1:
+        parser.error("--simulate must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+    
+    results = run_benchmarks(args.iterations, args.names)
+    print(f"{'benchmark':<40}{'per call':>14}{'bytes':>10}")
+    for name, (seconds, size) in results.items():
+        print(f"{name:<40}{seconds * 1e6:>11.1f} µs{'' if size is None else size:>10}")
+    
+    if args.simulate is not None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats = simulate_games(args.simulate, args.workers,
+                                   high_score_file=os.path.join(tmpdir, "simulation.json"))
+        print_simulation_report(stats)
+
+
+if __name__ == "__main__":
+    main()
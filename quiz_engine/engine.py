@@ -0,0 +1,45 @@
+"""
+Core quiz logic: answer checking, scoring and feedback
+"""
+
+
+def check_answer(question, answer):
+    """Return True if the option index answers the question correctly"""
+    return answer == question["answer"]
+
+
+def run_quiz(questions, get_answer, on_result=None):
+    """Run the game loop without any I/O and return the final score
+    
+    get_answer(number, question) must return an option index and
+    on_result(number, question, answer, correct) is called after each
+    question. Question numbers start at 1.
+    """
+    score = 0
+    for number, question in enumerate(questions, 1):
+        answer = get_answer(number, question)
+        correct = check_answer(question, answer)
+        if correct:
+            score += 1
+        if on_result:
+            on_result(number, question, answer, correct)
+    return score
+
+
+def percentage(score, total):
+    """Return the score as a percentage rounded to one decimal place"""
+    return round((score / total) * 100, 1) if total > 0 else 0
+
+
+def feedback(percent):
+    """Return a feedback message for a percentage score"""
+    if percent == 100:
+        return "🏆 Perfect score! You're a genius!"
+    elif percent >= 80:
+        return "🌟 Excellent work!"
+    elif percent >= 60:
+        return "👍 Good job!"
+    elif percent >= 40:
+        return "📚 Not bad, but keep studying!"
+    else:
+        return "💪 Keep practicing, you'll get better!"
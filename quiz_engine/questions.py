@@ -0,0 +1,90 @@
+"""
+Question sources for the quiz engine
+"""
+
+import random
+
+OPTION_LETTERS = ['A', 'B', 'C', 'D']
+
+# Upper bound on questions per AI-generated quiz
+MAX_AI_QUESTIONS = 20
+
+DEFAULT_QUESTIONS = [
+    {
+        "question": "What is the capital of France?",
+        "options": ["London", "Berlin", "Paris", "Madrid"],
+        "answer": 2
+    },
+    {
+        "question": "Which planet is known as the Red Planet?",
+        "options": ["Venus", "Mars", "Jupiter", "Saturn"],
+        "answer": 1
+    },
+    {
+        "question": "What is 2 + 2?",
+        "options": ["3", "4", "5", "6"],
+        "answer": 1
+    },
+    {
+        "question": "Who wrote 'Romeo and Juliet'?",
+        "options": ["Charles Dickens", "Mark Twain", "William Shakespeare", "Jane Austen"],
+        "answer": 2
+    },
+    {
+        "question": "What is the largest ocean on Earth?",
+        "options": ["Atlantic Ocean", "Indian Ocean", "Arctic Ocean", "Pacific Ocean"],
+        "answer": 3
+    },
+    {
+        "question": "Which programming language is known for its use in data science?",
+        "options": ["Java", "Python", "C++", "Ruby"],
+        "answer": 1
+    },
+    {
+        "question": "What year did World War II end?",
+        "options": ["1943", "1944", "1945", "1946"],
+        "answer": 2
+    },
+    {
+        "question": "What is the smallest prime number?",
+        "options": ["0", "1", "2", "3"],
+        "answer": 2
+    },
+    {
+        "question": "Which element has the chemical symbol 'O'?",
+        "options": ["Gold", "Oxygen", "Osmium", "Carbon"],
+        "answer": 1
+    },
+    {
+        "question": "What is the speed of light?",
+        "options": ["300,000 km/s", "150,000 km/s", "450,000 km/s", "600,000 km/s"],
+        "answer": 0
+    }
+]
+
+
+class DefaultQuestionSource:
+    """Serves the built-in question bank in random order"""
+    
+    def __init__(self, questions=None, rng=None):
+        self.questions = questions if questions is not None else DEFAULT_QUESTIONS
+        self.rng = rng or random
+    
+    def get_questions(self):
+        """Return every question in random order"""
+        return self.rng.sample(self.questions, len(self.questions))
+
+
+class AIQuestionSource:
+    """Generates questions on a topic with an AI client"""
+    
+    def __init__(self, client):
+        self.client = client
+    
+    @property
+    def available(self):
+        return self.client.available
+    
+    def get_questions(self, topic, num_questions):
+        """Return generated questions, or None if generation failed"""
+        return self.client.generate_questions(topic, num_questions)
@@ -0,0 +1,145 @@
+"""
+Headless multi-process game simulation for benchmarking the engine
+"""
+
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from multiprocessing import Lock, Pool
+
+from .engine import run_quiz
+from .questions import DefaultQuestionSource, OPTION_LETTERS
+from .storage import JSONHighScoreStore
+
+STRATEGIES = ["random", "perfect", "scripted"]
+
+_source = None
+_store = None
+_lock = None
+_strategy = None
+_script = None
+_seed = None
+
+
+def make_answer_strategy(strategy, rng, script=None):
+    """Build a get_answer callable for run_quiz
+    
+    'random' picks an option uniformly, 'perfect' always answers correctly
+    and 'scripted' cycles through the A-D letters in script.
+    """
+    if strategy == "random":
+        return lambda number, question: rng.randrange(len(question["options"]))
+    if strategy == "perfect":
+        return lambda number, question: question["answer"]
+    if strategy == "scripted":
+        answers = [OPTION_LETTERS.index(c) for c in (script or "").upper() if c in OPTION_LETTERS]
+        if not answers:
+            raise ValueError("Scripted strategy needs a script of A/B/C/D letters")
+        return lambda number, question: answers[(number - 1) % len(answers)]
+    raise ValueError(f"Unknown answer strategy: {strategy}")
+
+
+def _init_worker(lock, high_score_file, strategy, script, seed):
+    """Set up per-process state for simulate_games"""
+    global _source, _store, _lock, _strategy, _script, _seed
+    _source = DefaultQuestionSource()
+    _store = JSONHighScoreStore(high_score_file)
+    _lock = lock
+    _strategy = strategy
+    _script = script
+    _seed = seed
+
+
+def _play_game(game_index):
+    """Play one headless game and record its high score
+    
+    Returns (score, lock_wait, save_time) in seconds.
+    """
+    rng = random.Random(_seed + game_index)
+    questions = rng.sample(_source.questions, len(_source.questions))
+    score = run_quiz(questions, make_answer_strategy(_strategy, rng, _script))
+    
+    # The store reloads the file before appending, but two processes doing
+    # that at once would still drop an entry, so serialise the write.
+    wait_start = time.perf_counter()
+    with _lock:
+        save_start = time.perf_counter()
+        _store.add(f"sim-{game_index}", score, len(questions))
+        save_end = time.perf_counter()
+    return score, save_start - wait_start, save_end - save_start
+
+
+def simulate_games(num_games, workers=None, strategy="random", script=None,
+                   seed=0, high_score_file=None, overwrite=False):
+    """Play num_games headless games across a process pool and return stats
+    
+    Games are recorded in a temporary high score file unless high_score_file
+    is given. That file is emptied first so every run starts from the same
+    state, and a file that already has entries is only emptied when
+    overwrite is True.
+    """
+    if num_games < 1:
+        raise ValueError("Number of games must be at least 1")
+    if workers is not None and workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    # Fail here rather than inside every worker process
+    make_answer_strategy(strategy, random.Random(seed), script)
+    
+    if high_score_file is None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            return simulate_games(num_games, workers, strategy, script, seed,
+                                  os.path.join(tmpdir, "simulation.json"))
+    
+    store = JSONHighScoreStore(high_score_file)
+    if store.load() and not overwrite:
+        raise ValueError(f"{high_score_file} already has high scores; pass overwrite=True to replace them")
+    store.save([])
+    
+    workers = workers or os.cpu_count() or 1
+    lock = Lock()
+    start = time.perf_counter()
+    with Pool(workers, initializer=_init_worker,
+              initargs=(lock, high_score_file, strategy, script, seed)) as pool:
+        chunksize = max(1, num_games // (workers * 4))
+        results = pool.map(_play_game, range(num_games), chunksize=chunksize)
+    elapsed = time.perf_counter() - start
+    
+    scores = [score for score, _, _ in results]
+    lock_waits = [wait for _, wait, _ in results]
+    save_times = [save for _, _, save in results]
+    return {
+        "games": num_games,
+        "workers": workers,
+        "strategy": strategy,
+        "elapsed": elapsed,
+        "games_per_second": num_games / elapsed if elapsed > 0 else 0.0,
+        "score_distribution": dict(sorted(Counter(scores).items())),
+        "mean_score": sum(scores) / num_games if num_games else 0.0,
+        "lock_wait_total": sum(lock_waits),
+        "lock_wait_max": max(lock_waits, default=0.0),
+        "save_time_mean": sum(save_times) / num_games if num_games else 0.0,
+    }
+
+
+def print_simulation_report(stats):
+    """Print the results of simulate_games"""
+    print("\n" + "="*50)
+    print("SIMULATION RESULTS".center(50))
+    print("="*50)
+    print(f"Games: {stats['games']} ({stats['strategy']} answers, {stats['workers']} workers)")
+    print(f"Elapsed: {stats['elapsed']:.3f}s")
+    print(f"Throughput: {stats['games_per_second']:.1f} games/second")
+    print(f"Mean score: {stats['mean_score']:.2f}")
+    print("\nScore distribution:")
+    for score, count in stats["score_distribution"].items():
+        print(f"  {score:>2}: {count}")
+    print("\nHigh score file contention:")
+    print(f"  Total lock wait: {stats['lock_wait_total']:.3f}s")
+    print(f"  Max lock wait: {stats['lock_wait_max'] * 1000:.2f}ms")
+    print(f"  Mean load+save time: {stats['save_time_mean'] * 1000:.2f}ms")
+    # Every game reloads and rewrites the whole file, so later games cost more
+    print("\nEach game rewrites the whole high score file, so the cost per game")
+    print("grows with the number of games. Only compare runs of the same size.")
+    print("="*50 + "\n")
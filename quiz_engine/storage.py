@@ -0,0 +1,65 @@
+"""
+High score storage backends
+"""
+
+import json
+import os
+from datetime import datetime
+
+from .engine import percentage
+
+
+def leaderboard_key(entry):
+    """Sort key for leaderboard entries: percentage first, then raw score
+    
+    Entries written by older CLI versions have no total or percentage, so
+    they rank after every entry that has one, ordered by score.
+    """
+    return ("percentage" in entry, entry.get("percentage", 0), entry.get("score", 0))
+
+
+class JSONHighScoreStore:
+    """Stores high scores in a JSON file"""
+    
+    def __init__(self, path="high_scores.json"):
+        self.path = path
+    
+    def load(self):
+        """Load every high score entry from the file"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Error loading high scores: {e}")
+        return []
+    
+    def save(self, entries):
+        """Overwrite the file with the given entries"""
+        with open(self.path, 'w') as f:
+            json.dump(entries, f, indent=4)
+    
+    def add(self, name, score, total):
+        """Append a new high score entry, returning True on success
+        
+        The file is reloaded first so entries written by other processes
+        are kept.
+        """
+        try:
+            entries = self.load()
+            entries.append({
+                "name": name,
+                "score": score,
+                "total": total,
+                "percentage": percentage(score, total),
+                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+            self.save(entries)
+            return True
+        except Exception as e:
+            print(f"Error saving high score: {e}")
+            return False
+    
+    def top(self, limit=10):
+        """Return the best entries, highest first"""
+        return sorted(self.load(), key=leaderboard_key, reverse=True)[:limit]
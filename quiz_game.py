@@ -4,175 +4,42 @@ A simple quiz game that randomizes questions and stores high scores
 Now featuring AI-powered question generation using Google Gemini API
 """
 
+import argparse
 import json
-import random
-import os
-from datetime import datetime
-import google.generativeai as genai
+
+from quiz_engine import (AIQuestionSource, DefaultQuestionSource, GeminiClient,
+                         JSONHighScoreStore, MAX_AI_QUESTIONS, OPTION_LETTERS, feedback, percentage, run_quiz)
+from quiz_engine.simulation import STRATEGIES, print_simulation_report, simulate_games
 
 class QuizGame:
-    def __init__(self):
+    def __init__(self, high_score_file="high_scores.json", enable_ai=True):
         self.score = 0
-        self.questions = []
-        self.high_scores = []
-        self.high_score_file = "high_scores.json"
-        self.api_key = None
-        self.model = None
-        self.load_questions()
-        self.load_high_scores()
-        self.setup_gemini_api()
+        self.questions = DefaultQuestionSource()
+        self.store = JSONHighScoreStore(high_score_file)
+        self.ai = GeminiClient()
+        self.ai_questions = AIQuestionSource(self.ai)
+        if enable_ai:
+            self.setup_gemini_api()
     
     def setup_gemini_api(self):
         """Setup Google Gemini API"""
-        try:
-            # Try to load API key from config file
-            if os.path.exists("config.json"):
-                with open("config.json", 'r') as f:
-                    config = json.load(f)
-                    self.api_key = config.get("gemini_api_key")
-            
-            if self.api_key:
-                genai.configure(api_key=self.api_key)
-                self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-                print("✓ Gemini API configured successfully!")
-            else:
-                print("⚠ No API key found. AI question generation will be disabled.")
-                print("To enable AI features, add your API key to config.json")
-        except Exception as e:
-            print(f"⚠ Error setting up Gemini API: {e}")
-            self.model = None
+        if self.ai.setup():
+            print("✓ Gemini API configured successfully!")
+        elif self.ai.error:
+            print(f"⚠ Error setting up Gemini API: {self.ai.error}")
+        else:
+            print("⚠ No API key found. AI question generation will be disabled.")
+            print("To enable AI features, add your API key to config.json")
     
     def generate_ai_questions(self, topic, num_questions):
         """Generate questions using Gemini API"""
-        if not self.model:
-            print("❌ Gemini API is not configured. Cannot generate AI questions.")
-            return None
+        print(f"\n🤖 Generating {num_questions} questions about '{topic}'...")
+        print("⏳ Please wait, this may take a few seconds...\n")
         
-        try:
-            prompt = f"""Generate {num_questions} multiple choice quiz questions about {topic}.
-
-For each question, provide:
-1. The question text
-2. Four options labeled A, B, C, D
-3. The correct answer (just the letter: A, B, C, or D)
-
-Format your response as a valid JSON array with this exact structure:
-[
-    {{
-        "question": "Question text here?",
-        "options": ["A) First option", "B) Second option", "C) Third option", "D) Fourth option"],
-        "answer": "C"
-    }}
-]
-
-Make the questions engaging and educational. Ensure variety in difficulty levels.
-Return ONLY the JSON array, no additional text or markdown formatting."""
-
-            print(f"\n🤖 Generating {num_questions} questions about '{topic}'...")
-            print("⏳ Please wait, this may take a few seconds...\n")
-            
-            response = self.model.generate_content(prompt)
-            
-            # Extract JSON from response
-            response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            elif response_text.startswith("```"):
-                response_text = response_text[3:]
-            
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            
-            response_text = response_text.strip()
-            
-            # Parse JSON
-            questions = json.loads(response_text)
-            
+        questions = self.ai_questions.get_questions(topic, num_questions)
+        if questions:
             print(f"✓ Successfully generated {len(questions)} questions!\n")
-            return questions
-            
-        except json.JSONDecodeError as e:
-            print(f"❌ Error parsing AI response: {e}")
-            print("The AI response was not in valid JSON format.")
-            return None
-        except Exception as e:
-            print(f"❌ Error generating questions: {e}")
-            return None
-    
-    def load_questions(self):
-        """Load quiz questions from the questions database"""
-        self.questions = [
-            {
-                "question": "What is the capital of France?",
-                "options": ["A) London", "B) Berlin", "C) Paris", "D) Madrid"],
-                "answer": "C"
-            },
-            {
-                "question": "Which planet is known as the Red Planet?",
-                "options": ["A) Venus", "B) Mars", "C) Jupiter", "D) Saturn"],
-                "answer": "B"
-            },
-            {
-                "question": "What is 2 + 2?",
-                "options": ["A) 3", "B) 4", "C) 5", "D) 6"],
-                "answer": "B"
-            },
-            {
-                "question": "Who wrote 'Romeo and Juliet'?",
-                "options": ["A) Charles Dickens", "B) Mark Twain", "C) William Shakespeare", "D) Jane Austen"],
-                "answer": "C"
-            },
-            {
-                "question": "What is the largest ocean on Earth?",
-                "options": ["A) Atlantic Ocean", "B) Indian Ocean", "C) Arctic Ocean", "D) Pacific Ocean"],
-                "answer": "D"
-            },
-            {
-                "question": "Which programming language is known for its use in data science?",
-                "options": ["A) Java", "B) Python", "C) C++", "D) Ruby"],
-                "answer": "B"
-            },
-            {
-                "question": "What year did World War II end?",
-                "options": ["A) 1943", "B) 1944", "C) 1945", "D) 1946"],
-                "answer": "C"
-            },
-            {
-                "question": "What is the smallest prime number?",
-                "options": ["A) 0", "B) 1", "C) 2", "D) 3"],
-                "answer": "C"
-            },
-            {
-                "question": "Which element has the chemical symbol 'O'?",
-                "options": ["A) Gold", "B) Oxygen", "C) Osmium", "D) Carbon"],
-                "answer": "B"
-            },
-            {
-                "question": "What is the speed of light?",
-                "options": ["A) 300,000 km/s", "B) 150,000 km/s", "C) 450,000 km/s", "D) 600,000 km/s"],
-                "answer": "A"
-            }
-        ]
-    
-    def load_high_scores(self):
-        """Load high scores from JSON file"""
-        try:
-            if os.path.exists(self.high_score_file):
-                with open(self.high_score_file, 'r') as f:
-                    self.high_scores = json.load(f)
-        except Exception as e:
-            print(f"Error loading high scores: {e}")
-            self.high_scores = []
-    
-    def save_high_scores(self):
-        """Save high scores to JSON file"""
-        try:
-            with open(self.high_score_file, 'w') as f:
-                json.dump(self.high_scores, f, indent=4)
-        except Exception as e:
-            print(f"Error saving high scores: {e}")
+        return questions
     
     def display_high_scores(self):
         """Display the top 10 high scores"""
@@ -180,24 +47,18 @@ Return ONLY the JSON array, no additional text or markdown formatting."""
         print("HIGH SCORES LEADERBOARD".center(50))
         print("="*50)
         
-        if not self.high_scores:
+        top_scores = self.store.top(10)
+        if not top_scores:
             print("No high scores yet! Be the first to set a record!")
         else:
-            sorted_scores = sorted(self.high_scores, key=lambda x: x['score'], reverse=True)[:10]
-            for i, entry in enumerate(sorted_scores, 1):
-                print(f"{i}. {entry['name']}: {entry['score']} points - {entry['date']}")
+            for i, entry in enumerate(top_scores, 1):
+                if "total" in entry:
+                    result = f"{entry['score']}/{entry['total']} ({entry['percentage']}%)"
+                else:
+                    result = f"{entry['score']} points"
+                print(f"{i}. {entry['name']}: {result} - {entry['date']}")
         print("="*50 + "\n")
     
-    def add_high_score(self, name, score):
-        """Add a new high score entry"""
-        entry = {
-            "name": name,
-            "score": score,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        self.high_scores.append(entry)
-        self.save_high_scores()
-    
     def play_game(self, custom_questions=None):
         """Main game loop"""
         print("\n" + "="*50)
@@ -215,32 +76,31 @@ Return ONLY the JSON array, no additional text or markdown formatting."""
         if custom_questions:
             quiz_questions = custom_questions
         else:
-            # Randomize questions
-            quiz_questions = random.sample(self.questions, len(self.questions))
+            quiz_questions = self.questions.get_questions()
         
-        self.score = 0
         total_questions = len(quiz_questions)
         
-        # Ask each question
-        for i, q in enumerate(quiz_questions, 1):
+        def ask(i, q):
             print(f"\nQuestion {i}/{total_questions}:")
             print(q["question"])
-            for option in q["options"]:
-                print(option)
+            for letter, option in zip(OPTION_LETTERS, q["options"]):
+                print(f"{letter}) {option}")
             
             # Get user answer
             while True:
                 answer = input("\nYour answer (A/B/C/D): ").strip().upper()
-                if answer in ['A', 'B', 'C', 'D']:
-                    break
+                if answer in OPTION_LETTERS:
+                    return OPTION_LETTERS.index(answer)
                 print("Invalid input! Please enter A, B, C, or D.")
-            
-            # Check answer
-            if answer == q["answer"]:
+        
+        def show_result(i, q, answer, correct):
+            if correct:
                 print("✓ Correct!")
-                self.score += 1
             else:
-                print(f"✗ Wrong! The correct answer was {q['answer']}")
+                print(f"✗ Wrong! The correct answer was {OPTION_LETTERS[q['answer']]}")
+        
+        # Ask each question
+        self.score = run_quiz(quiz_questions, ask, show_result)
         
         # Display final score
         print("\n" + "="*50)
@@ -248,28 +108,19 @@ Return ONLY the JSON array, no additional text or markdown formatting."""
         print("="*50)
         print(f"\n{player_name}, you scored: {self.score}/{total_questions}")
         
-        percentage = (self.score / total_questions) * 100
-        print(f"Percentage: {percentage:.1f}%")
+        percent = percentage(self.score, total_questions)
+        print(f"Percentage: {percent:.1f}%")
         
         # Performance feedback
-        if percentage == 100:
-            print("🏆 Perfect score! You're a genius!")
-        elif percentage >= 80:
-            print("🌟 Excellent work!")
-        elif percentage >= 60:
-            print("👍 Good job!")
-        elif percentage >= 40:
-            print("📚 Not bad, but keep studying!")
-        else:
-            print("💪 Keep practicing, you'll get better!")
+        print(feedback(percent))
         
         # Save high score
-        self.add_high_score(player_name, self.score)
+        self.store.add(player_name, self.score, total_questions)
         print(f"\nYour score has been saved!")
     
     def play_custom_quiz(self):
         """Play quiz with AI-generated questions"""
-        if not self.model:
+        if not self.ai.available:
             print("\n❌ AI question generation is not available.")
             print("Please configure your Gemini API key in config.json")
             print("\nSteps to get API key:")
@@ -292,11 +143,11 @@ Return ONLY the JSON array, no additional text or markdown formatting."""
         # Get number of questions
         while True:
             try:
-                num_questions = int(input("How many questions do you want? (1-20): ").strip())
-                if 1 <= num_questions <= 20:
+                num_questions = int(input(f"How many questions do you want? (1-{MAX_AI_QUESTIONS}): ").strip())
+                if 1 <= num_questions <= MAX_AI_QUESTIONS:
                     break
                 else:
-                    print("❌ Please enter a number between 1 and 20.")
+                    print(f"❌ Please enter a number between 1 and {MAX_AI_QUESTIONS}.")
             except ValueError:
                 print("❌ Please enter a valid number.")
         
@@ -363,17 +214,47 @@ Return ONLY the JSON array, no additional text or markdown formatting."""
             print("✓ API key saved successfully!")
             
             # Reconfigure the API
-            self.api_key = api_key
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-            
-            print("✓ Gemini API configured and ready to use!")
+            if self.ai.configure(api_key):
+                print("✓ Gemini API configured and ready to use!")
+            else:
+                print(f"❌ Error configuring Gemini API: {self.ai.error}")
             
         except Exception as e:
             print(f"❌ Error saving API key: {e}")
 
 def main():
     """Main entry point of the program"""
+    parser = argparse.ArgumentParser(description="Quiz Game with High Score Tracking")
+    parser.add_argument("--simulate", type=int, metavar="GAMES",
+                        help="run GAMES headless games and print a benchmark report")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="random",
+                        help="answer strategy for simulated games")
+    parser.add_argument("--script", help="answer letters for the scripted strategy, e.g. ABCD")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for simulated games")
+    parser.add_argument("--high-score-file",
+                        help="high score file for simulated games (default: a temporary file)")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="allow --high-score-file to be emptied if it already has scores")
+    args = parser.parse_args()
+    
+    if args.simulate is not None:
+        if args.simulate < 1:
+            parser.error("--simulate must be at least 1")
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be at least 1")
+        if args.strategy == "scripted" and not args.script:
+            parser.error("--strategy scripted requires --script")
+        if args.high_score_file and not args.overwrite and JSONHighScoreStore(args.high_score_file).load():
+            parser.error(f"{args.high_score_file} already has high scores; pass --overwrite to replace them")
+        try:
+            stats = simulate_games(args.simulate, args.workers, args.strategy, args.script,
+                                   args.seed, args.high_score_file, args.overwrite)
+        except ValueError as e:
+            parser.error(str(e))
+        print_simulation_report(stats)
+        return
+    
     game = QuizGame()
     game.main_menu()
 
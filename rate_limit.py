@@ -0,0 +1,183 @@
+"""
+Per-client rate limiting and admission control for the Flask app
+
+Token buckets are kept in process memory by default. Set RATE_LIMIT_DB to a
+SQLite file path to share them between worker processes.
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask import jsonify, request
+
+
+class MemoryBucketStore:
+    """Token buckets in a dict, shared by the threads of one process"""
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def take(self, key, rate, capacity, cost, now):
+        """Take cost tokens from key's bucket
+
+        Returns (allowed, retry_after) where retry_after is the number of
+        seconds until enough tokens are available.
+        """
+        with self.lock:
+            tokens, updated = self.buckets.pop(key, (capacity, now))
+            tokens, allowed, retry_after = refill_and_take(tokens, updated, rate, capacity, cost, now)
+            # Re-inserting keeps the dict in least recently used order, so
+            # the bucket idle the longest is the one evicted when full
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+            return allowed, retry_after
+
+
+class SQLiteBucketStore:
+    """Token buckets in a SQLite file, shared by every worker process
+
+    Rows are deleted once their bucket has refilled, checked at most once
+    per cleanup_interval seconds. If the database stays locked for longer
+    than timeout seconds the request is let through rather than failing.
+    """
+
+    def __init__(self, path, timeout=1.0, cleanup_interval=60):
+        self.path = path
+        self.timeout = timeout
+        self.cleanup_interval = cleanup_interval
+        self.next_cleanup = 0.0
+        # One connection for the whole process, used by one thread at a time.
+        # The dev server runs every request on a new thread, so a connection
+        # per thread would be opened and set up again on every request.
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # full_at is when the bucket will be back to capacity, after which
+        # the row is the same as no row at all
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, "
+            "tokens REAL NOT NULL, updated REAL NOT NULL, full_at REAL NOT NULL)"
+        )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def take(self, key, rate, capacity, cost, now):
+        """Take cost tokens from key's bucket, see MemoryBucketStore.take"""
+        with self.lock:
+            return self._take(key, rate, capacity, cost, now)
+
+    def _take(self, key, rate, capacity, cost, now):
+        conn = self.conn
+        try:
+            # BEGIN IMMEDIATE takes the write lock up front so the read and
+            # the update below are atomic across processes
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens, allowed, retry_after = refill_and_take(tokens, updated, rate, capacity, cost, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated, full_at) VALUES (?, ?, ?, ?)",
+                (key, tokens, now, now + (capacity - tokens) / rate),
+            )
+            if now >= self.next_cleanup:
+                conn.execute("DELETE FROM buckets WHERE full_at <= ?", (now,))
+                self.next_cleanup = now + self.cleanup_interval
+            conn.execute("COMMIT")
+        except sqlite3.OperationalError as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"⚠ Rate limit store unavailable, allowing request: {e}")
+            return True, 0.0
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        return allowed, retry_after
+
+
+def refill_and_take(tokens, updated, rate, capacity, cost, now):
+    """Refill a bucket for the time since updated, then try to take cost
+
+    Returns (tokens, allowed, retry_after).
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    if tokens >= cost:
+        return tokens - cost, True, 0.0
+    return tokens, False, (cost - tokens) / rate
+
+
+class TokenBucketLimiter:
+    """Allows rate requests per second per key with bursts up to capacity"""
+
+    def __init__(self, rate, capacity, store=None, name="default"):
+        self.rate = rate
+        self.capacity = capacity
+        self.store = store or MemoryBucketStore()
+        self.name = name
+        # Buckets shared between processes need a clock that agrees across them
+        self.clock = time.monotonic if isinstance(self.store, MemoryBucketStore) else time.time
+
+    def acquire(self, key, cost=1):
+        """Return (allowed, retry_after) for one request from key"""
+        return self.store.take(f"{self.name}:{key}", self.rate, self.capacity, cost, self.clock())
+
+
+class AdmissionGate:
+    """Caps how many expensive operations run at once in this process
+
+    Requests over the cap are turned away immediately instead of queueing.
+    """
+
+    def __init__(self, max_in_flight):
+        self.max_in_flight = max_in_flight
+        self.semaphore = threading.BoundedSemaphore(max_in_flight)
+
+    def try_enter(self):
+        return self.semaphore.acquire(blocking=False)
+
+    def leave(self):
+        self.semaphore.release()
+
+
+def store_from_env():
+    """Use SQLite if RATE_LIMIT_DB is set, otherwise process memory"""
+    path = os.environ.get("RATE_LIMIT_DB")
+    return SQLiteBucketStore(path) if path else MemoryBucketStore()
+
+
+def client_key():
+    """Identify the client by address
+
+    Session cookies can be dropped by the client, so they are not used. Put
+    the app behind werkzeug's ProxyFix if it runs behind a reverse proxy.
+    """
+    return request.remote_addr or "unknown"
+
+
+def too_many_requests(retry_after, error="Too many requests, please slow down"):
+    """Build a 429 response with a Retry-After header in whole seconds"""
+    response = jsonify({'success': False, 'error': error})
+    response.status_code = 429
+    response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def check_rate_limit(limiter, cost=1):
+    """Return a 429 response if the current client is over limiter, else None"""
+    allowed, retry_after = limiter.acquire(client_key(), cost)
+    if not allowed:
+        return too_many_requests(retry_after)
+    return None
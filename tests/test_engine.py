@@ -0,0 +1,105 @@
+"""
+Tests for the shared quiz_engine package
+"""
+
+import json
+
+import pytest
+
+from quiz_engine import (DEFAULT_QUESTIONS, JSONHighScoreStore, check_answer, leaderboard_key,
+                         parse_questions, percentage, run_quiz)
+
+QUESTION = {"question": "What is 2 + 2?", "options": ["3", "4", "5", "6"], "answer": 1}
+
+
+def test_check_answer_compares_option_index():
+    assert check_answer(QUESTION, 1)
+    assert not check_answer(QUESTION, 2)
+
+
+def test_run_quiz_counts_correct_answers_and_reports_each_result():
+    results = []
+    answers = {1: 1, 2: 0, 3: 1}
+    score = run_quiz([QUESTION] * 3, lambda number, question: answers[number],
+                     lambda number, question, answer, correct: results.append((number, correct)))
+    assert score == 2
+    assert results == [(1, True), (2, False), (3, True)]
+
+
+def test_percentage_of_zero_questions_is_zero():
+    assert percentage(0, 0) == 0
+    assert percentage(2, 3) == 66.7
+
+
+def test_leaderboard_key_ranks_old_entries_after_new_ones():
+    entries = [
+        {"name": "old-high", "score": 8},
+        {"name": "new-zero", "score": 0, "total": 10, "percentage": 0.0},
+        {"name": "old-low", "score": 3},
+        {"name": "new-full", "score": 10, "total": 10, "percentage": 100.0},
+        {"name": "new-half-of-more", "score": 10, "total": 20, "percentage": 50.0},
+        {"name": "new-half", "score": 5, "total": 10, "percentage": 50.0},
+    ]
+    ranked = [e["name"] for e in sorted(entries, key=leaderboard_key, reverse=True)]
+    assert ranked == ["new-full", "new-half-of-more", "new-half", "new-zero", "old-high", "old-low"]
+
+
+def test_store_add_appends_entry_with_percentage(tmp_path):
+    store = JSONHighScoreStore(str(tmp_path / "scores.json"))
+    assert store.load() == []
+    assert store.add("ann", 3, 4)
+    assert store.add("bob", 1, 4)
+    entries = store.load()
+    assert [(e["name"], e["score"], e["total"], e["percentage"]) for e in entries] == [
+        ("ann", 3, 4, 75.0), ("bob", 1, 4, 25.0)]
+
+
+def test_store_add_keeps_entries_written_by_others(tmp_path):
+    path = str(tmp_path / "scores.json")
+    first, second = JSONHighScoreStore(path), JSONHighScoreStore(path)
+    first.add("ann", 1, 2)
+    second.add("bob", 2, 2)
+    assert [e["name"] for e in first.load()] == ["ann", "bob"]
+
+
+def test_store_top_sorts_and_limits(tmp_path):
+    store = JSONHighScoreStore(str(tmp_path / "scores.json"))
+    for i in range(12):
+        store.add(f"p{i}", i, 11)
+    top = store.top(10)
+    assert len(top) == 10
+    assert [e["name"] for e in top[:2]] == ["p11", "p10"]
+
+
+def test_parse_questions_strips_code_fences():
+    text = "```json\n" + json.dumps(DEFAULT_QUESTIONS[:2]) + "\n```"
+    assert parse_questions(text) == DEFAULT_QUESTIONS[:2]
+    assert parse_questions("```" + json.dumps([QUESTION]) + "```") == [QUESTION]
+
+
+@pytest.mark.parametrize("answer", [1, "1", " 1 ", "B", "b"])
+def test_parse_questions_normalizes_answer_to_index(answer):
+    item = dict(QUESTION, answer=answer)
+    assert parse_questions(json.dumps([item]))[0]["answer"] == 1
+
+
+@pytest.mark.parametrize("item", [
+    dict(QUESTION, answer=4),
+    dict(QUESTION, answer=-1),
+    dict(QUESTION, answer="E"),
+    dict(QUESTION, answer=True),
+    dict(QUESTION, answer=None),
+    dict(QUESTION, options=["3", "4", "5"]),
+    dict(QUESTION, options=["3", "4", "5", "6", "7"]),
+    dict(QUESTION, options="3, 4, 5, 6"),
+    dict(QUESTION, question=""),
+    "not a question",
+])
+def test_parse_questions_drops_invalid_items(item):
+    assert parse_questions(json.dumps([item, QUESTION])) == [QUESTION]
+
+
+@pytest.mark.parametrize("text", ["not json", "{}", "[]", json.dumps([dict(QUESTION, answer=9)])])
+def test_parse_questions_rejects_unusable_replies(text):
+    with pytest.raises(ValueError):
+        parse_questions(text)
@@ -0,0 +1,176 @@
+"""
+Tests for rate_limit.py and the limits applied in app.py
+"""
+
+import multiprocessing
+import sqlite3
+import threading
+
+import flask
+import flask_cors  # noqa: F401  (imported by app.py)
+import google.generativeai  # noqa: F401  (imported by GeminiClient when a key is set)
+import pytest
+
+import app as web
+from rate_limit import (AdmissionGate, MemoryBucketStore, SQLiteBucketStore,
+                        TokenBucketLimiter, too_many_requests)
+
+
+def test_bucket_allows_burst_then_refuses():
+    store = MemoryBucketStore()
+    results = [store.take("k", rate=1, capacity=3, cost=1, now=0.0)[0] for _ in range(4)]
+    assert results == [True, True, True, False]
+
+
+def test_bucket_refills_at_rate():
+    store = MemoryBucketStore()
+    for _ in range(3):
+        store.take("k", rate=2, capacity=3, cost=1, now=0.0)
+    assert store.take("k", rate=2, capacity=3, cost=1, now=0.1)[0] is False
+    # 0.5s at 2 tokens/second refills one token
+    assert store.take("k", rate=2, capacity=3, cost=1, now=0.6)[0] is True
+
+
+def test_refill_is_capped_at_capacity():
+    store = MemoryBucketStore()
+    store.take("k", rate=1, capacity=2, cost=1, now=0.0)
+    results = [store.take("k", rate=1, capacity=2, cost=1, now=100.0)[0] for _ in range(3)]
+    assert results == [True, True, False]
+
+
+def test_retry_after_is_time_until_next_token():
+    store = MemoryBucketStore()
+    store.take("k", rate=0.5, capacity=1, cost=1, now=0.0)
+    allowed, retry_after = store.take("k", rate=0.5, capacity=1, cost=1, now=1.0)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemoryBucketStore(max_keys=2)
+    store.take("a", rate=1, capacity=1, cost=1, now=0.0)
+    store.take("b", rate=1, capacity=1, cost=1, now=0.0)
+    store.take("a", rate=1, capacity=1, cost=1, now=0.0)
+    store.take("c", rate=1, capacity=1, cost=1, now=0.0)
+    assert list(store.buckets) == ["a", "c"]
+
+
+def test_limiters_sharing_a_store_keep_their_own_rates():
+    store = MemoryBucketStore(max_keys=3)
+    requests = TokenBucketLimiter(rate=10, capacity=40, store=store, name="requests")
+    ai = TokenBucketLimiter(rate=5 / 60, capacity=5, store=store, name="ai")
+    for _ in range(5):
+        assert ai.acquire("client")[0]
+    for i in range(2):
+        requests.acquire(f"other-{i}")
+    allowed, retry_after = ai.acquire("client")
+    assert not allowed
+    assert retry_after > 1
+
+
+def test_sqlite_store_refills_and_reports_retry_after(tmp_path):
+    store = SQLiteBucketStore(str(tmp_path / "buckets.db"))
+    assert store.take("k", rate=1, capacity=1, cost=1, now=10.0) == (True, 0.0)
+    allowed, retry_after = store.take("k", rate=1, capacity=1, cost=1, now=10.25)
+    assert not allowed
+    assert retry_after == pytest.approx(0.75)
+    assert store.take("k", rate=1, capacity=1, cost=1, now=11.0)[0]
+
+
+def test_sqlite_store_deletes_refilled_rows(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    store = SQLiteBucketStore(path, cleanup_interval=0)
+    store.take("old", rate=1, capacity=1, cost=1, now=0.0)
+    store.take("new", rate=1, capacity=1, cost=1, now=100.0)
+    keys = [row[0] for row in sqlite3.connect(path).execute("SELECT key FROM buckets")]
+    assert keys == ["new"]
+
+
+def test_sqlite_store_allows_request_when_locked(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    store = SQLiteBucketStore(path, timeout=0.05)
+    blocker = sqlite3.connect(path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    try:
+        assert store.take("k", rate=1, capacity=0, cost=1, now=0.0) == (True, 0.0)
+    finally:
+        blocker.execute("ROLLBACK")
+
+
+def test_sqlite_store_is_shared_between_threads(tmp_path):
+    store = SQLiteBucketStore(str(tmp_path / "buckets.db"), timeout=5)
+    limiter = TokenBucketLimiter(rate=1e-6, capacity=10, store=store)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(limiter.acquire("shared")[0]))
+               for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(results) == 10
+    store.close()
+
+
+def _acquire_many(path):
+    limiter = TokenBucketLimiter(rate=1e-6, capacity=10, store=SQLiteBucketStore(path, timeout=5))
+    return sum(limiter.acquire("shared")[0] for _ in range(10))
+
+
+def test_sqlite_store_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    SQLiteBucketStore(path)
+    with multiprocessing.Pool(4) as pool:
+        allowed = pool.map(_acquire_many, [path] * 4)
+    assert sum(allowed) == 10
+
+
+def test_admission_gate_caps_in_flight():
+    gate = AdmissionGate(max_in_flight=2)
+    assert gate.try_enter()
+    assert gate.try_enter()
+    assert not gate.try_enter()
+    gate.leave()
+    assert gate.try_enter()
+
+
+def test_too_many_requests_rounds_retry_after_up():
+    app = flask.Flask(__name__)
+    with app.test_request_context():
+        response = too_many_requests(1.2)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert too_many_requests(0.01).headers["Retry-After"] == "1"
+
+
+@pytest.fixture
+def web_app(monkeypatch):
+    monkeypatch.setattr(web.request_limiter, "store", MemoryBucketStore())
+    monkeypatch.setattr(web.ai_limiter, "store", MemoryBucketStore())
+    return web
+
+
+@pytest.mark.parametrize("num_questions", [0, 21, 1000, "abc"])
+def test_start_quiz_rejects_bad_question_counts(web_app, num_questions):
+    response = web_app.app.test_client().post(
+        '/start-quiz', json={'type': 'custom', 'topic': 'x', 'num_questions': num_questions})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_requests_over_the_limit_get_429(web_app, monkeypatch):
+    monkeypatch.setattr(web_app.request_limiter, "capacity", 2)
+    client = web_app.app.test_client()
+    statuses = [client.get('/check-ai-status').status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+    assert int(client.get('/check-ai-status').headers["Retry-After"]) >= 1
+
+
+def test_busy_ai_gate_does_not_use_a_token(web_app, monkeypatch):
+    monkeypatch.setattr(web_app.ai_client, "model", object())
+    monkeypatch.setattr(web_app, "ai_gate", AdmissionGate(max_in_flight=1))
+    web_app.ai_gate.try_enter()
+    response = web_app.app.test_client().post(
+        '/start-quiz', json={'type': 'custom', 'topic': 'x', 'num_questions': 5})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(web_app.AI_BUSY_RETRY_AFTER)
+    assert web_app.ai_limiter.store.buckets == {}
@@ -0,0 +1,123 @@
+"""
+Tests for web_assets.py: pre-compressed pages and JSON response compression
+"""
+
+import gzip
+
+import brotli
+import pytest
+from flask import Flask, jsonify
+
+import app as web
+from web_assets import JSON_COMPRESS_THRESHOLD, compress_json_response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Keep the per-client request limit out of the way of repeated requests
+    monkeypatch.setattr(web.request_limiter, "capacity", float("inf"))
+    return web.app.test_client()
+
+
+def decode(response):
+    encoding = response.headers.get("Content-Encoding")
+    if encoding == "br":
+        return brotli.decompress(response.data)
+    if encoding == "gzip":
+        return gzip.decompress(response.data)
+    return response.data
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("br, gzip", "br"),
+    ("gzip", "gzip"),
+    ("gzip, br;q=0.5", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("*", "br"),
+    ("*;q=0, identity", None),
+    ("identity", None),
+    ("", None),
+])
+def test_index_picks_encoding_from_accept_encoding(client, accept, expected):
+    response = client.get("/", headers={"Accept-Encoding": accept})
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == expected
+    assert decode(response).startswith(b"<!DOCTYPE html>")
+
+
+def test_index_variants_have_the_same_content(client):
+    bodies = {decode(client.get("/", headers={"Accept-Encoding": accept}))
+              for accept in ["br", "gzip", "identity"]}
+    assert len(bodies) == 1
+
+
+def test_index_varies_on_accept_encoding(client):
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_index_etag_differs_per_encoding(client):
+    etags = {client.get("/", headers={"Accept-Encoding": accept}).headers["ETag"]
+             for accept in ["br", "gzip", "identity"]}
+    assert len(etags) == 3
+
+
+def test_index_304_when_etag_matches_chosen_encoding(client):
+    etag = client.get("/", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_index_200_when_etag_is_for_another_encoding(client):
+    etag = client.get("/", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response = client.get("/", headers={"Accept-Encoding": "br", "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "br"
+
+
+def test_index_304_for_weakened_etag(client):
+    etag = client.get("/", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+    response = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": "W/" + etag})
+    assert response.status_code == 304
+
+
+@pytest.fixture
+def json_client():
+    app = Flask(__name__)
+    app.after_request(compress_json_response)
+
+    @app.route("/json/<int:size>")
+    def sized(size):
+        # jsonify adds the quotes and a trailing newline around the string
+        return jsonify("x" * (size - 3))
+
+    return app.test_client()
+
+
+def test_json_at_threshold_is_compressed(json_client):
+    response = json_client.get(f"/json/{JSON_COMPRESS_THRESHOLD}", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(decode(response)) == JSON_COMPRESS_THRESHOLD
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_json_below_threshold_is_not_compressed(json_client):
+    response = json_client.get(f"/json/{JSON_COMPRESS_THRESHOLD - 1}", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert len(response.data) == JSON_COMPRESS_THRESHOLD - 1
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_json_uses_best_accepted_encoding(json_client):
+    response = json_client.get("/json/4096", headers={"Accept-Encoding": "br, gzip"})
+    assert response.headers["Content-Encoding"] == "br"
+    assert len(decode(response)) == 4096
+
+
+def test_json_is_not_compressed_without_accept_encoding(json_client):
+    response = json_client.get("/json/4096", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in response.headers
+    assert len(response.data) == 4096
@@ -0,0 +1,112 @@
+"""
+Pre-built, pre-compressed frontend assets for the Flask app
+
+Pages are rendered and minified once at startup and kept in memory with
+gzip (and brotli, when installed) variants, so requests only pick an
+encoding and check the ETag.
+"""
+
+import gzip
+import hashlib
+import re
+
+from flask import Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# JSON responses smaller than this are not worth compressing
+JSON_COMPRESS_THRESHOLD = 1024
+
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+
+
+def minify_html(html):
+    """Minify a page with inline CSS and JS
+
+    Only comments and indentation are removed. Line breaks are kept so
+    JavaScript that relies on automatic semicolon insertion still works.
+    """
+    html = HTML_COMMENT.sub("", html)
+    lines = []
+    for line in html.splitlines():
+        line = line.strip()
+        if line and not line.startswith("//"):
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def available_encodings():
+    """Content codings this server can produce, best first"""
+    return (["br"] if brotli else []) + ["gzip", "identity"]
+
+
+def compress(body, encoding, level=None):
+    """Compress bytes with the given content coding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if level is None else level)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9 if level is None else level, mtime=0)
+    return body
+
+
+def negotiate_encoding(encodings):
+    """Pick the best of encodings for the current request's Accept-Encoding"""
+    return request.accept_encodings.best_match(encodings) or "identity"
+
+
+class PrecompressedAsset:
+    """An in-memory response body with one pre-built variant per encoding"""
+
+    def __init__(self, body, mimetype, cache_control="no-cache"):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # Strong ETags must differ between encodings of the same resource
+        self.variants = {}
+        for encoding in available_encodings():
+            etag = digest if encoding == "identity" else f"{digest}-{encoding}"
+            self.variants[encoding] = (compress(body, encoding), etag)
+
+    def response(self):
+        """Build the response for the current request"""
+        encoding = negotiate_encoding(list(self.variants))
+        body, etag = self.variants[encoding]
+
+        # If-None-Match uses weak comparison, so W/"..." from a proxy still matches
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype=self.mimetype)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = self.cache_control
+        response.vary.add("Accept-Encoding")
+        return response
+
+
+def compress_json_response(response):
+    """after_request hook that compresses large JSON responses"""
+    if (response.mimetype != "application/json"
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    body = response.get_data()
+    if len(body) < JSON_COMPRESS_THRESHOLD:
+        return response
+
+    encoding = negotiate_encoding(available_encodings())
+    if encoding == "identity":
+        return response
+    # Dynamic responses use faster settings than the startup build
+    response.set_data(compress(body, encoding, level=5 if encoding == "br" else 6))
+    response.headers["Content-Encoding"] = encoding
+    return response
@@ -0,0 +1,84 @@
+"""
+Web benchmarks, added to the shared quiz_engine benchmark suite
+
+Run with: python web_bench.py [names] [-n ITERATIONS]
+"""
+
+import os
+import threading
+
+from flask import render_template
+
+from quiz_engine.bench import benchmark, main
+from rate_limit import MemoryBucketStore, SQLiteBucketStore, TokenBucketLimiter
+from web_assets import available_encodings
+
+import app as web
+
+
+@benchmark("index_page_jinja_render", report_size=True)
+def bench_index_jinja(tmpdir):
+    """The page as it was served before: rendered per request, uncompressed"""
+    ctx = web.app.test_request_context("/")
+    
+    def render():
+        with ctx:
+            return render_template("index.html").encode("utf-8")
+    return render
+
+
+def bench_index_page(encoding):
+    def setup(tmpdir):
+        # Reusing one request context keeps its setup cost out of the timing
+        ctx = web.app.test_request_context("/", headers={"Accept-Encoding": encoding})
+        
+        def serve():
+            with ctx:
+                return web.index_page.response().get_data()
+        return serve
+    return setup
+
+
+for encoding in available_encodings():
+    benchmark(f"index_page_{encoding}", report_size=True)(bench_index_page(encoding))
+
+
+class UnlimitedStore:
+    """Bucket store that allows everything, the baseline for the limiter"""
+    
+    def take(self, key, rate, capacity, cost, now):
+        return True, 0.0
+
+
+def bench_cheap_route(make_store, new_thread=False):
+    """Time GET /favicon.ico through the full app with the given store"""
+    def setup(tmpdir):
+        # before_request looks request_limiter up on every request
+        web.request_limiter = TokenBucketLimiter(rate=1e9, capacity=1e9, store=make_store(tmpdir))
+        client = web.app.test_client()
+        get = lambda: client.get("/favicon.ico").data
+        if not new_thread:
+            return get
+        
+        # Like the threaded dev server, which runs each request on its own thread
+        def get_on_new_thread():
+            thread = threading.Thread(target=get)
+            thread.start()
+            thread.join()
+            return b""
+        return get_on_new_thread
+    return setup
+
+
+benchmark("cheap_route_no_limiter")(bench_cheap_route(lambda tmpdir: UnlimitedStore()))
+benchmark("cheap_route_memory_limiter")(bench_cheap_route(lambda tmpdir: MemoryBucketStore()))
+benchmark("cheap_route_sqlite_limiter")(
+    bench_cheap_route(lambda tmpdir: SQLiteBucketStore(os.path.join(tmpdir, "buckets.db"))))
+benchmark("cheap_route_no_limiter_new_thread")(
+    bench_cheap_route(lambda tmpdir: UnlimitedStore(), new_thread=True))
+benchmark("cheap_route_sqlite_limiter_new_thread")(
+    bench_cheap_route(lambda tmpdir: SQLiteBucketStore(os.path.join(tmpdir, "threads.db")), new_thread=True))
+
+
+if __name__ == "__main__":
+    main("Benchmark the quiz engine and the web app")